@@ -2,13 +2,14 @@ import os
 import argparse
 import sys
 from dotenv import load_dotenv
-from pinecone import Pinecone
 
 load_dotenv()
 
 
 def _get_pinecone():
-    return Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+    from services.pinecone_client import get_pinecone
+
+    return get_pinecone()
 
 
 def _index_name():
@@ -17,25 +18,61 @@ def _index_name():
 
 def cmd_research(args):
     from graph.research_graph import build_research_graph
+    from graph.nodes.synthesizer import report_header
 
-    graph = build_research_graph(debug=args.verbose)
+    graph = build_research_graph(debug=args.verbose, checkpoint=not args.no_checkpoint)
     config = {"configurable": {"thread_id": args.thread_id}}
 
-    result = graph.invoke(
+    state = {}
+    streamed = False
+
+    for mode, chunk in graph.stream(
         {"query": args.query, "max_iterations": args.max_iterations},
         config,
-    )
-
-    print(result.get("final_answer", "No answer produced"))
+        stream_mode=["values", "messages"],
+    ):
+        if mode == "values":
+            state = chunk
+            continue
+
+        message, metadata = chunk
+        if metadata.get("langgraph_node") != "synthesize" or not isinstance(message.content, str):
+            continue
+
+        if not streamed:
+            print(report_header(state.get("query", args.query), state.get("iterations", 0)))
+            streamed = True
+        print(message.content, end="", flush=True)
+
+    if streamed:
+        print()
+    else:
+        print(state.get("final_answer", "No answer produced"))
 
 
 def cmd_ingest(args):
-    from ingestion.pipeline import ingest
-
-    result = ingest(args.pdf)
-    print(f"\nIngested: {result['document_title']}")
-    print(f"Sections: {result['sections']}")
-    print(f"Chunks: {result['chunks']}")
+    from ingestion.pipeline import ingest_many
+
+    if args.key and len(args.key) != len(args.pdf):
+        print("--key must be given once per PDF", file=sys.stderr)
+        sys.exit(2)
+
+    failed = 0
+    for result in ingest_many(args.pdf, dedup=args.dedup, document_keys=args.key):
+        if "error" in result:
+            failed += 1
+            print(f"\nFailed: {result['pdf_path']}: {result['error']}", file=sys.stderr)
+            continue
+        print(f"\nIngested: {result['document_title']} ({result['pdf_path']})")
+        print(f"Sections: {result['sections']}")
+        print(f"Chunks: {result['chunks']}")
+        if result["skipped"]:
+            print(f"Unchanged (skipped): {result['skipped']}")
+        if result["removed"]:
+            print(f"Stale (removed): {result['removed']}")
+
+    if failed:
+        sys.exit(1)
 
 
 def cmd_status(args):
@@ -54,7 +91,7 @@ def cmd_status(args):
 
     print(f"\nIndex: {name}")
     print(f"Dimension: {stats.dimension}")
-    print(f"Metric: {stats.metric}")
+    print(f"Metric: {getattr(stats, 'metric', None) or pc.describe_index(name).metric}")
     print(f"Total vectors: {stats.total_vector_count}")
 
     for ns, ns_stats in stats.namespaces.items():
@@ -62,14 +99,28 @@ def cmd_status(args):
         print(f"  Namespace '{label}': {ns_stats.vector_count} vectors")
 
 
+def _iter_metadata(index, name):
+    from services.pinecone_client import is_pod_index
+
+    if is_pod_index(name):
+        # Pod-based indexes cannot list ids; fall back to a zero-vector query.
+        dimension = index.describe_index_stats().dimension
+        for match in index.query(vector=[0.0] * dimension, top_k=10000, include_metadata=True).matches:
+            yield match.metadata or {}
+        return
+
+    for ids in index.list():
+        for vector in index.fetch(ids=ids).vectors.values():
+            yield vector.metadata or {}
+
+
 def cmd_list(args):
     pc = _get_pinecone()
     name = _index_name()
     index = pc.Index(name)
 
     docs = {}
-    for match in index.query(vector=[0.0] * 384, top_k=10000, include_metadata=True).matches:
-        meta = match.metadata
+    for meta in _iter_metadata(index, name):
         title = meta.get("document_title", "Unknown")
         if title not in docs:
             docs[title] = {"chunks": 0, "sections": set(), "pages": set()}
@@ -106,8 +157,12 @@ def build_parser():
     research_parser.add_argument("-n", "--max-iterations", type=int, default=3, help="Max research iterations (default: 3)")
     research_parser.add_argument("-t", "--thread-id", default="cli-run", help="Thread ID for state persistence (default: cli-run)")
     research_parser.add_argument("-v", "--verbose", action="store_true", help="Show state monitoring during research")
+    research_parser.add_argument("--no-checkpoint", action="store_true", help="Skip per-step state checkpointing for one-shot runs")
 
-    subparsers.add_parser("ingest", help="Ingest a PDF into the knowledge base").add_argument("pdf", help="Path to PDF file")
+    ingest_parser = subparsers.add_parser("ingest", help="Ingest PDFs into the knowledge base")
+    ingest_parser.add_argument("pdf", nargs="+", help="Path to PDF file(s)")
+    ingest_parser.add_argument("--dedup", action="store_true", help="Skip chunks already indexed with identical content")
+    ingest_parser.add_argument("--key", action="append", help="Stable document key, repeated once per PDF; replaces the version previously indexed under it (default: file content hash)")
     subparsers.add_parser("status", help="Show vector store index stats")
     subparsers.add_parser("list", help="List indexed documents")
 
@@ -1,5 +1,21 @@
+from concurrent.futures import ThreadPoolExecutor
+
 from state.research_state import ResearchState
 
+MAX_RETRIEVAL_WORKERS = 8
+
+
+def _append_documents(documents: list, passages, source: str, query: str):
+    append = documents.append
+    for content in passages:
+        content = content.strip()
+        if content:
+            append({
+                "content": content,
+                "source": source,
+                "query": query,
+            })
+
 
 def retrieve(state: ResearchState) -> ResearchState:
     sub_queries = state.get("sub_queries", [])
@@ -11,33 +27,30 @@ def retrieve(state: ResearchState) -> ResearchState:
     batch = sub_queries[:batch_size]
     remaining = sub_queries[batch_size:]
 
-    from retrieval.retrieval_tools import search_internal_docs, search_web
+    from retrieval.retrieval_tools import search_web, vector_retriever
 
     all_documents = []
     errors = []
 
-    for query in batch:
+    unique_queries = list(dict.fromkeys(batch))
+
+    with ThreadPoolExecutor(max_workers=min(len(unique_queries) + 1, MAX_RETRIEVAL_WORKERS)) as pool:
+        internal_future = pool.submit(vector_retriever.search_batch, unique_queries)
+        web_futures = [pool.submit(search_web.invoke, query) for query in unique_queries]
+
         try:
-            internal_results = search_internal_docs.invoke(query)
-            web_results = search_web.invoke(query)
-
-            for content in internal_results.split("\n\n"):
-                if content.strip():
-                    all_documents.append({
-                        "content": content.strip(),
-                        "source": "internal",
-                        "query": query,
-                    })
-
-            for content in web_results.split("\n\n"):
-                if content.strip():
-                    all_documents.append({
-                        "content": content.strip(),
-                        "source": "web",
-                        "query": query,
-                    })
+            internal_batch = internal_future.result()
         except Exception as e:
-            errors.append({"query": query, "error": str(e)})
+            internal_batch = [[] for _ in unique_queries]
+            errors.extend({"query": query, "source": "internal", "error": str(e)} for query in unique_queries)
+
+        for query, internal_results, web_future in zip(unique_queries, internal_batch, web_futures):
+            _append_documents(all_documents, (r["content"] for r in internal_results), "internal", query)
+
+            try:
+                _append_documents(all_documents, web_future.result().split("\n\n"), "web", query)
+            except Exception as e:
+                errors.append({"query": query, "source": "web", "error": str(e)})
 
     return {
         "current_query": batch[-1] if batch else "",
@@ -1,3 +1,6 @@
+import re
+from collections import OrderedDict
+
 from state.research_state import ResearchState
 from services.llm import LLMService
 
@@ -10,24 +13,43 @@ Rules:
 - Cover: definition/overview, key details, practical aspects, edge cases
 - Return ONLY a JSON object: {"sub_queries": ["query1", "query2", ...]}"""
 
+PLAN_CACHE_SIZE = 256
+
+_WHITESPACE = re.compile(r"\s+")
+
+_plan_cache: "OrderedDict[str, list[str]]" = OrderedDict()
+
+
+def _plan_key(query: str) -> str:
+    return _WHITESPACE.sub(" ", query.lower()).strip().rstrip("?.").rstrip()
+
 
 def decompose(state: ResearchState) -> ResearchState:
     query = state.get("query", "")
-
-    llm = LLMService()
-
-    try:
-        result = llm.invoke_json(
-            SYSTEM_PROMPT,
-            f"Break down this research query into focused sub-queries: {query}",
-        )
-        sub_queries = result.get("sub_queries", [])
-    except Exception:
-        sub_queries = [
-            f"{query} overview",
-            f"{query} key findings",
-            f"{query} recent developments",
-        ]
+    key = _plan_key(query)
+
+    sub_queries = _plan_cache.get(key)
+    if sub_queries is not None:
+        _plan_cache.move_to_end(key)
+    else:
+        llm = LLMService()
+
+        try:
+            result = llm.invoke_json(
+                SYSTEM_PROMPT,
+                f"Break down this research query into focused sub-queries: {query}",
+            )
+            sub_queries = result.get("sub_queries", [])
+            if sub_queries:
+                _plan_cache[key] = sub_queries
+                if len(_plan_cache) > PLAN_CACHE_SIZE:
+                    _plan_cache.popitem(last=False)
+        except Exception:
+            sub_queries = [
+                f"{query} overview",
+                f"{query} key findings",
+                f"{query} recent developments",
+            ]
 
     if not sub_queries:
         sub_queries = [f"{query} overview"]
@@ -75,38 +75,37 @@ def synthesize(state: ResearchState) -> ResearchState:
         f"Write a detailed research report addressing this query:\n\n{query}\n\nUse the following research findings:\n\n{context}",
     )
 
-    header = f"# Research Report\n\n**Query:** {query}\n**Iterations:** {iterations}\n"
-
     return {
-        "final_answer": header + "\n" + response,
+        "final_answer": report_header(query, iterations) + "\n" + response,
         "done": True,
     }
 
 
+def report_header(query: str, iterations: int) -> str:
+    return f"# Research Report\n\n**Query:** {query}\n**Iterations:** {iterations}\n"
+
+
 def _build_context(state: ResearchState) -> str:
     query = state.get("query", "")
     facts = state.get("extracted_facts", [])
     summaries = state.get("summaries", [])
     sources = state.get("sources", [])
 
-    lines = [f"Research query: {query}\n"]
+    parts = [f"Research query: {query}\n"]
 
     if summaries:
-        lines.append("## Research Summary")
-        for s in summaries:
-            lines.append(f"- {s}")
-        lines.append("")
+        parts.append("## Research Summary")
+        parts.append("\n".join(f"- {s}" for s in summaries))
+        parts.append("")
 
     if facts:
-        lines.append(f"## Findings ({len(facts)} total)")
-        for i, f in enumerate(facts, 1):
-            lines.append(f"{i}. {f}")
-        lines.append("")
+        parts.append(f"## Findings ({len(facts)} total)")
+        parts.append("\n".join(f"{i}. {f}" for i, f in enumerate(facts, 1)))
+        parts.append("")
 
     if sources:
         unique = list(dict.fromkeys(sources))
-        lines.append(f"## Sources ({len(unique)} total)")
-        for i, s in enumerate(unique, 1):
-            lines.append(f"{i}. {s}")
+        parts.append(f"## Sources ({len(unique)} total)")
+        parts.append("\n".join(f"{i}. {s}" for i, s in enumerate(unique, 1)))
 
-    return "\n".join(lines)
+    return "\n".join(parts)
@@ -1,3 +1,5 @@
+import sys
+
 from langgraph.graph import StateGraph, START, END
 from langgraph.checkpoint.memory import InMemorySaver
 
@@ -11,9 +13,12 @@ from graph.nodes.generate_queries import generate_queries
 
 
 def _state_snapshot(state: dict, node_name: str):
-    print(f"\n{'=' * 60}")
-    print(f"NODE: {node_name}")
-    print(f"{'=' * 60}")
+    lines = [
+        "",
+        "=" * 60,
+        f"NODE: {node_name}",
+        "=" * 60,
+    ]
     keys = [
         "query", "sub_queries", "queries_in_batch", "current_query",
         "documents", "extracted_facts", "summaries", "sources",
@@ -24,15 +29,17 @@ def _state_snapshot(state: dict, node_name: str):
         if v is None:
             continue
         if isinstance(v, list):
-            print(f"  {k}: [{len(v)} items]")
+            lines.append(f"  {k}: [{len(v)} items]")
             for i, item in enumerate(v[:3]):
                 preview = str(item)[:120]
-                print(f"    [{i}] {preview}")
+                lines.append(f"    [{i}] {preview}")
             if len(v) > 3:
-                print(f"    ... and {len(v) - 3} more")
+                lines.append(f"    ... and {len(v) - 3} more")
         else:
-            print(f"  {k}: {v}")
-    print()
+            lines.append(f"  {k}: {v}")
+    lines.append("\n")
+    sys.stdout.write("\n".join(lines))
+    sys.stdout.flush()
 
 
 def _wrap_node(node_fn, name):
@@ -43,7 +50,7 @@ def _wrap_node(node_fn, name):
     return wrapped
 
 
-def build_research_graph(debug: bool = True):
+def build_research_graph(debug: bool = True, checkpoint: bool = True):
     builder = StateGraph(ResearchState)
 
     nodes = {
@@ -74,4 +81,4 @@ def build_research_graph(debug: bool = True):
     builder.add_edge("generate_queries", "retrieve")
     builder.add_edge("synthesize", END)
 
-    return builder.compile(checkpointer=InMemorySaver())
+    return builder.compile(checkpointer=InMemorySaver() if checkpoint else None)
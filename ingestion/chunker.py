@@ -1,5 +1,7 @@
-from .utils import generate_chunk_id
-from .config import CHUNK_OVERLAP
+from bisect import bisect_left, bisect_right
+
+from .utils import generate_chunk_id, hash_text
+from .config import CHUNK_OVERLAP, EMBEDDING_MODEL, EMBEDDING_NORMALIZE
 
 
 def _walk_tree(node, sections, heading_stack=None):
@@ -34,56 +36,69 @@ def collect_sections(doc_tree):
     return sections
 
 
-def chunk_sections(sections, document_title, chunk_size=150, chunk_overlap=None):
+def chunk_sections(sections, document_title, chunk_size=150, chunk_overlap=None, document_id=None):
     if chunk_overlap is None:
         chunk_overlap = CHUNK_OVERLAP
 
     stride = max(chunk_size - chunk_overlap, 1)
+    title = str(document_title or "")
+    id_key = document_id or hash_text(title)
+    embedding_tag = f"{EMBEDDING_MODEL}:{EMBEDDING_NORMALIZE}"
     chunks = []
 
     for section in sections:
-        words = " ".join(section["content"]).split()
+        nodes = section["nodes"]
+        words = []
+        starts = []
+        ends = []
+        for node in nodes:
+            starts.append(len(words))
+            words.extend(node.get("text", "").split())
+            ends.append(len(words))
+
         total = len(words)
 
         if total == 0:
             continue
 
+        heading_path = section["heading_path"]
+        top_heading = section["top_heading"]
+        total_chunks = (total + stride - 1) // stride
+
         chunk_idx = 0
         for i in range(0, total, stride):
             window = words[i:i + chunk_size]
             text = " ".join(window)
 
-            if len(text.strip()) < 10:
+            if len(text) < 10:
                 continue
 
             node_ids = []
             pages = set()
-            word_pos = 0
-            for node in section["nodes"]:
-                node_words = node.get("text", "").split()
-                node_end = len(node_words)
-                if i < node_end + word_pos and i + chunk_size > word_pos:
-                    node_ids.append(node["id"])
-                    page = node.get("page")
-                    if page is not None:
-                        pages.add(page)
-                word_pos += node_end
+            for node in nodes[bisect_right(ends, i):bisect_left(starts, i + chunk_size)]:
+                node_ids.append(node["id"])
+                page = node.get("page")
+                if page is not None:
+                    pages.add(page)
 
             meta = {
-                "document_title": str(document_title or ""),
-                "section": section["heading_path"],
+                "document_title": title,
+                "section": heading_path,
                 "chunk_index": chunk_idx,
-                "total_chunks": (total + stride - 1) // stride,
+                "total_chunks": total_chunks,
             }
-            if section["top_heading"]:
-                meta["top_heading"] = section["top_heading"]
+            if document_id:
+                meta["document_id"] = document_id
+            if top_heading:
+                meta["top_heading"] = top_heading
             if pages:
                 meta["pages"] = [str(p) for p in sorted(pages)]
             if node_ids:
                 meta["node_ids"] = node_ids[:10]
+            meta["content_hash"] = hash_text(f"{embedding_tag}\0{text}\0{sorted(meta.items())!r}")
 
             chunks.append({
-                "id": generate_chunk_id(),
+                "id": generate_chunk_id(id_key, len(chunks)),
                 "text": text,
                 "metadata": meta,
             })
@@ -1,6 +1,22 @@
+import os
+
 EMBEDDING_MODEL = "all-MiniLM-L6-v2"
+EMBEDDING_BATCH_SIZE = 64
+EMBEDDING_NORMALIZE = True
+
+PARSE_CACHE_DIR = os.getenv(
+    "ARISTO_PARSE_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "aristo", "parsed"),
+)
 
 CHUNK_SIZE = 150
 CHUNK_OVERLAP = 30
 
-VECTOR_INDEX_NAME = "aristo-docs"
\ No newline at end of file
+VECTOR_INDEX_NAME = "aristo-docs"
+
+UPSERT_BATCH_SIZE = 100
+UPSERT_CONCURRENCY = 4
+FETCH_BATCH_SIZE = 100
+
+INGEST_WORKERS = 2
+INGEST_BATCH_SIZE = 256
@@ -1,6 +1,15 @@
-from docling.datamodel.base_models import InputFormat
-from docling.datamodel.pipeline_options import PdfPipelineOptions
-from docling.document_converter import DocumentConverter, PdfFormatOption
+import json
+import tempfile
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from .utils import hash_file
+
+PARSE_CACHE_VERSION = 1
 
 
 def build_tree(doc):
@@ -34,8 +43,46 @@ def build_tree(doc):
     return root
 
 
-def parse_document(pdf_path: str):
+def _dump_tree(tree) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(tree)
+    return json.dumps(tree).encode("utf-8")
+
+
+def _load_tree(path: Path):
+    data = path.read_bytes()
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def parse_document(
+    pdf_path: str,
+    cache_dir: str | None = None,
+    content_hash: str | None = None,
+    num_threads: int | None = None,
+):
+    if cache_dir:
+        cache_path = Path(cache_dir) / f"v{PARSE_CACHE_VERSION}-{content_hash or hash_file(pdf_path)}.json"
+    else:
+        cache_path = None
+    if cache_path is not None and cache_path.exists():
+        return _load_tree(cache_path)
+
+    from docling.datamodel.base_models import InputFormat
+    from docling.datamodel.pipeline_options import (
+        AcceleratorDevice,
+        AcceleratorOptions,
+        PdfPipelineOptions,
+    )
+    from docling.document_converter import DocumentConverter, PdfFormatOption
+
     pipeline_options = PdfPipelineOptions()
+    if num_threads is not None:
+        pipeline_options.accelerator_options = AcceleratorOptions(
+            num_threads=num_threads,
+            device=AcceleratorDevice.AUTO,
+        )
 
     doc_converter = DocumentConverter(
         format_options={
@@ -46,4 +93,10 @@ def parse_document(pdf_path: str):
     conv_res = doc_converter.convert(pdf_path)
     tree = build_tree(conv_res.document)
 
+    if cache_path is not None:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        with tempfile.NamedTemporaryFile(dir=cache_path.parent, suffix=".tmp", delete=False) as tmp:
+            tmp.write(_dump_tree(tree))
+        Path(tmp.name).replace(cache_path)
+
     return tree
@@ -1,14 +1,37 @@
-from sentence_transformers import SentenceTransformer
-from .config import EMBEDDING_MODEL
+import threading
 
-model = SentenceTransformer(EMBEDDING_MODEL)
+from .config import EMBEDDING_MODEL, EMBEDDING_BATCH_SIZE, EMBEDDING_NORMALIZE
 
+_model = None
+_model_lock = threading.Lock()
 
-def embed_chunks(chunks):
+
+def get_model():
+    global _model
+    with _model_lock:
+        if _model is None:
+            from sentence_transformers import SentenceTransformer
+
+            model = SentenceTransformer(EMBEDDING_MODEL)
+            if model.device.type == "cuda":
+                model.half()
+            _model = model
+    return _model
+
+
+def encode(texts, **kwargs):
+    kwargs.setdefault("batch_size", EMBEDDING_BATCH_SIZE)
+    kwargs.setdefault("convert_to_numpy", True)
+    kwargs.setdefault("normalize_embeddings", EMBEDDING_NORMALIZE)
+    kwargs.setdefault("show_progress_bar", False)
+    return get_model().encode(texts, **kwargs)
+
+
+def embed_chunks(chunks, batch_size=EMBEDDING_BATCH_SIZE):
     texts = [c["text"] for c in chunks]
-    embeddings = model.encode(texts)
+    embeddings = encode(texts, batch_size=batch_size)
 
-    for chunk, emb in zip(chunks, embeddings):
-        chunk["embedding"] = emb.tolist()
+    for chunk, emb in zip(chunks, embeddings.astype("float32", copy=False).tolist()):
+        chunk["embedding"] = emb
 
     return chunks
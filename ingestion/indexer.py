@@ -1,16 +1,30 @@
-import os
-from pinecone import Pinecone
-from dotenv import load_dotenv
+import threading
+from collections import deque
 
-from .config import VECTOR_INDEX_NAME
+from services.pinecone_client import get_pinecone, is_pod_index
 
-load_dotenv()
+from .config import VECTOR_INDEX_NAME, UPSERT_BATCH_SIZE, UPSERT_CONCURRENCY, FETCH_BATCH_SIZE
 
-pc = Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
-index = pc.Index(VECTOR_INDEX_NAME)
+_index = None
+_index_lock = threading.Lock()
 
 
-def index_chunks(chunks):
+def _get_index():
+    global _index
+    with _index_lock:
+        if _index is None:
+            _index = get_pinecone().Index(VECTOR_INDEX_NAME, pool_threads=UPSERT_CONCURRENCY)
+    return _index
+
+
+def _wait(request):
+    # gRPC upserts return futures; REST upserts return multiprocessing ApplyResults.
+    if hasattr(request, "result"):
+        return request.result()
+    return request.get()
+
+
+def index_chunks(chunks, batch_size=UPSERT_BATCH_SIZE, max_concurrency=UPSERT_CONCURRENCY):
     vectors = []
     for chunk in chunks:
         meta = dict(chunk["metadata"])
@@ -20,4 +34,44 @@ def index_chunks(chunks):
             "values": chunk["embedding"],
             "metadata": meta,
         })
-    index.upsert(vectors=vectors)
+
+    index = _get_index()
+    pending = deque()
+    for i in range(0, len(vectors), batch_size):
+        if len(pending) >= max_concurrency:
+            _wait(pending.popleft())
+        pending.append(index.upsert(vectors=vectors[i:i + batch_size], async_req=True))
+
+    while pending:
+        _wait(pending.popleft())
+
+
+def filter_changed(chunks, batch_size=FETCH_BATCH_SIZE):
+    index = _get_index()
+    changed = []
+    for i in range(0, len(chunks), batch_size):
+        batch = chunks[i:i + batch_size]
+        existing = index.fetch(ids=[c["id"] for c in batch]).vectors
+        for chunk in batch:
+            stored = existing.get(chunk["id"])
+            stored_hash = (stored.metadata or {}).get("content_hash") if stored is not None else None
+            if stored_hash != chunk["metadata"]["content_hash"]:
+                changed.append(chunk)
+    return changed
+
+
+def delete_stale(document_key, keep_ids, batch_size=FETCH_BATCH_SIZE):
+    if is_pod_index(VECTOR_INDEX_NAME):
+        return None
+
+    index = _get_index()
+    prefix = f"{document_key}#"
+    stale = [
+        vector_id
+        for ids in index.list(prefix=prefix)
+        for vector_id in ids
+        if vector_id not in keep_ids and vector_id[len(prefix):].isdigit()
+    ]
+    for i in range(0, len(stale), batch_size):
+        index.delete(ids=stale[i:i + batch_size])
+    return len(stale)
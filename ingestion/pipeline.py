@@ -1,15 +1,19 @@
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
 from .document_parser import parse_document
 from .chunker import collect_sections, chunk_sections
 from .embedding import embed_chunks
-from .indexer import index_chunks
+from .indexer import index_chunks, filter_changed, delete_stale
+from .config import INGEST_WORKERS, INGEST_BATCH_SIZE, PARSE_CACHE_DIR
+from .utils import hash_file
 
 logger = logging.getLogger(__name__)
 
 
-def ingest(pdf_path):
+def ingest(pdf_path, dedup=False, num_threads=None, cache_dir=PARSE_CACHE_DIR, document_key=None):
     pdf_path = str(pdf_path)
 
     if not Path(pdf_path).exists():
@@ -19,38 +23,98 @@ def ingest(pdf_path):
         raise ValueError(f"Expected PDF file, got: {pdf_path}")
 
     try:
-        print("Parsing document...")
-        tree = parse_document(pdf_path)
+        file_hash = hash_file(pdf_path)
+        document_id = document_key or file_hash
 
-        print("Collecting sections...")
+        print(f"[{pdf_path}] Parsing document...")
+        tree = parse_document(
+            pdf_path,
+            cache_dir=cache_dir,
+            content_hash=file_hash,
+            num_threads=num_threads,
+        )
+
+        print(f"[{pdf_path}] Collecting sections...")
         sections = collect_sections(tree)
         if not sections:
             logger.warning("No sections found in document tree")
 
         document_title = tree.get("title")
-        print(f"Document: {document_title}")
-        print(f"Sections found: {len(sections)}")
+        print(f"[{pdf_path}] Document: {document_title}")
+        print(f"[{pdf_path}] Sections found: {len(sections)}")
 
-        print("Chunking...")
-        chunks = chunk_sections(sections, document_title)
-        print(f"Chunks created: {len(chunks)}")
+        print(f"[{pdf_path}] Chunking...")
+        chunks = chunk_sections(sections, document_title, document_id=document_id)
+        print(f"[{pdf_path}] Chunks created: {len(chunks)}")
 
         if not chunks:
             raise ValueError("No chunks generated from document")
 
-        print("Embedding...")
-        chunks = embed_chunks(chunks)
+        print(f"[{pdf_path}] Embedding and indexing...")
+        skipped = 0
+        for start in range(0, len(chunks), INGEST_BATCH_SIZE):
+            batch = chunks[start:start + INGEST_BATCH_SIZE]
+            if dedup:
+                changed = filter_changed(batch)
+                skipped += len(batch) - len(changed)
+                batch = changed
+                if not batch:
+                    continue
+
+            batch = embed_chunks(batch)
+            index_chunks(batch)
+            for chunk in batch:
+                del chunk["embedding"]
 
-        print("Indexing...")
-        index_chunks(chunks)
+        removed = delete_stale(document_id, {chunk["id"] for chunk in chunks})
+        if removed is None:
+            logger.warning("Pod-based index: stale chunks from earlier versions were not removed")
+            removed = 0
 
-        print(f"Ingestion complete: {len(chunks)} chunks indexed")
+        if skipped:
+            print(f"[{pdf_path}] Skipped {skipped} unchanged chunks")
+        if removed:
+            print(f"[{pdf_path}] Removed {removed} stale chunks")
+        print(f"[{pdf_path}] Ingestion complete: {len(chunks) - skipped} chunks indexed")
         return {
+            "pdf_path": pdf_path,
+            "document_id": document_id,
             "document_title": document_title,
             "sections": len(sections),
             "chunks": len(chunks),
+            "skipped": skipped,
+            "removed": removed,
         }
 
     except Exception as e:
         logger.error(f"Ingestion failed for {pdf_path}: {e}")
         raise
+
+
+def _ingest_or_error(pdf_path, dedup, num_threads, document_key):
+    try:
+        return ingest(pdf_path, dedup=dedup, num_threads=num_threads, document_key=document_key)
+    except Exception as e:
+        return {"pdf_path": str(pdf_path), "error": str(e)}
+
+
+def ingest_many(pdf_paths, max_workers=INGEST_WORKERS, dedup=False, document_keys=None):
+    if document_keys is None:
+        document_keys = [None] * len(pdf_paths)
+    elif len(document_keys) != len(pdf_paths):
+        raise ValueError("document_keys must match pdf_paths one-to-one")
+
+    workers = min(len(pdf_paths), max_workers)
+    if workers <= 1:
+        return [_ingest_or_error(path, dedup, None, key) for path, key in zip(pdf_paths, document_keys)]
+
+    num_threads = max((os.cpu_count() or 4) // workers, 1)
+    results = [None] * len(pdf_paths)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            pool.submit(_ingest_or_error, path, dedup, num_threads, key): i
+            for i, (path, key) in enumerate(zip(pdf_paths, document_keys))
+        }
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    return results
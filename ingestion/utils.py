@@ -1,9 +1,24 @@
-import uuid
+import hashlib
 
 
-def generate_chunk_id():
-    return str(uuid.uuid4())
+def generate_chunk_id(document_key, position):
+    return f"{document_key}#{position}"
+
+
+def hash_text(text):
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
 
 
 def flatten_text(content):
     return " ".join(content).strip()
+
+
+def hash_file(path, chunk_size=1 << 20):
+    with open(path, "rb") as f:
+        if hasattr(hashlib, "file_digest"):
+            return hashlib.file_digest(f, lambda: hashlib.blake2b(digest_size=16)).hexdigest()
+
+        digest = hashlib.blake2b(digest_size=16)
+        while block := f.read(chunk_size):
+            digest.update(block)
+    return digest.hexdigest()
@@ -6,13 +6,6 @@ vector_retriever = VectorRetriever(top_k=5, fetch_k=20, use_rerank=True)
 web_retriever = WebRetriever()
 
 
-@tool
-def search_internal_docs(query: str) -> str:
-    """Search internal documents stored in the knowledge base."""
-    results = vector_retriever.search(query)
-    return "\n\n".join(r["content"] for r in results)
-
-
 @tool
 def search_web(query: str) -> str:
     """Search the internet for recent information."""
@@ -1,5 +1,10 @@
 import os
-from typing import Dict, List
+import json
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, Hashable, List
 from dotenv import load_dotenv
 from langchain_pinecone import PineconeVectorStore
 from langchain_community.embeddings import HuggingFaceEmbeddings
@@ -8,16 +13,51 @@ from flashrank import Ranker, RerankRequest
 load_dotenv()
 
 PINECONE_INDEX_NAME = os.getenv("PINECONE_INDEX_NAME", "aristo-docs")
+VECTORSTORE_RETRY_SECONDS = 30
+EMBEDDING_CACHE_SIZE = 1024
 
 _rerank_cache: Dict[str, "Ranker"] = {}
+_rerank_lock = threading.Lock()
 
 
 def _get_ranker(model_name: str = "ms-marco-MiniLM-L-12-v2"):
-    if model_name not in _rerank_cache:
-        _rerank_cache[model_name] = Ranker(model_name=model_name, cache_dir="/tmp/flashrank")
+    with _rerank_lock:
+        if model_name not in _rerank_cache:
+            _rerank_cache[model_name] = Ranker(model_name=model_name, cache_dir="/tmp/flashrank")
     return _rerank_cache[model_name]
 
 
+class _LRUCache:
+    def __init__(self, max_size: int, ttl: float | None = None):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._data: "OrderedDict[Hashable, tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+            stored_at, value = entry
+            if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+                del self._data[key]
+                return None
+            self._data.move_to_end(key)
+            return value
+
+    def put(self, key: Hashable, value: Any):
+        with self._lock:
+            self._data[key] = (time.monotonic(), value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.max_size:
+                self._data.popitem(last=False)
+
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
 class VectorRetriever:
     def __init__(
         self,
@@ -25,17 +65,33 @@ class VectorRetriever:
         top_k: int = 5,
         fetch_k: int = 20,
         use_rerank: bool = True,
+        cache_size: int = 256,
+        cache_ttl: float | None = 300,
+        max_workers: int = 4,
     ):
         self.top_k = top_k
         self.fetch_k = fetch_k
         self.use_rerank = use_rerank
         self.index_name = index_name
+        self.max_workers = max_workers
         self._vectorstore = None
-        self.embeddings = HuggingFaceEmbeddings(model_name="all-MiniLM-L6-v2")
+        self._retry_at = 0.0
+        self._embeddings = None
+        self._result_cache = _LRUCache(cache_size, ttl=cache_ttl)
+        self._embedding_cache = _LRUCache(EMBEDDING_CACHE_SIZE)
+
+    @property
+    def embeddings(self):
+        if self._embeddings is None:
+            self._embeddings = HuggingFaceEmbeddings(
+                model_name="all-MiniLM-L6-v2",
+                encode_kwargs={"normalize_embeddings": True},
+            )
+        return self._embeddings
 
     @property
     def vectorstore(self):
-        if self._vectorstore is None:
+        if self._vectorstore is None and time.monotonic() >= self._retry_at:
             try:
                 self._vectorstore = PineconeVectorStore(
                     index_name=self.index_name,
@@ -44,13 +100,62 @@ class VectorRetriever:
                 )
             except Exception:
                 self._vectorstore = None
+                self._retry_at = time.monotonic() + VECTORSTORE_RETRY_SECONDS
         return self._vectorstore
 
     def search(self, query: str, filter: dict | None = None) -> List[Dict]:
-        if self.vectorstore is None:
-            return []
+        return self.search_batch([query], filter=filter)[0]
 
-        docs = self.vectorstore.similarity_search(query, k=self.fetch_k, filter=filter)
+    def search_batch(self, queries: List[str], filter: dict | None = None) -> List[List[Dict]]:
+        filter_key = json.dumps(filter, sort_keys=True, default=str) if filter else None
+        results = [self._result_cache.get((query, filter_key)) for query in queries]
+        misses = [i for i, cached in enumerate(results) if cached is None]
+
+        if not misses:
+            return results
+
+        if self.vectorstore is None:
+            return [cached if cached is not None else [] for cached in results]
+
+        vectors = self._embed([queries[i] for i in misses])
+
+        if len(misses) == 1:
+            searched = [self._search_vector(queries[misses[0]], vectors[0], filter)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(misses), self.max_workers)) as pool:
+                searched = list(pool.map(
+                    lambda args: self._search_vector(*args, filter),
+                    [(queries[i], vector) for i, vector in zip(misses, vectors)],
+                ))
+
+        for i, found in zip(misses, searched):
+            results[i] = found
+            self._result_cache.put((queries[i], filter_key), found)
+
+        return results
+
+    def clear_cache(self):
+        self._result_cache.clear()
+        self._embedding_cache.clear()
+
+    def _embed(self, texts: List[str]) -> List[List[float]]:
+        vectors = [self._embedding_cache.get(text) for text in texts]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+
+        if missing:
+            for i in missing:
+                vectors[i] = self.embeddings.embed_query(texts[i])
+                self._embedding_cache.put(texts[i], vectors[i])
+
+        return vectors
+
+    def _search_vector(self, query: str, vector: List[float], filter: dict | None) -> List[Dict]:
+        docs = [
+            doc
+            for doc, _ in self.vectorstore.similarity_search_by_vector_with_score(
+                vector, k=self.fetch_k, filter=filter
+            )
+        ]
 
         if not docs:
             return []
@@ -68,19 +173,16 @@ class VectorRetriever:
         ]
 
     def _rerank(self, query: str, docs) -> list:
-        passages = [
-            {"id": str(i), "text": d.page_content, "meta": d.metadata}
-            for i, d in enumerate(docs)
-        ]
+        passages = [{"id": i, "text": d.page_content} for i, d in enumerate(docs)]
 
         rerank_req = RerankRequest(query=query, passages=passages)
         ranker = _get_ranker()
-        results = ranker.rerank(rerank_req)
+        results = ranker.rerank(rerank_req)[: self.top_k]
 
         reranked = []
         for r in results:
-            original = docs[int(r["id"])]
-            original.metadata["relevance_score"] = r["score"]
+            original = docs[r["id"]]
+            original.metadata["relevance_score"] = float(r["score"])
             reranked.append(original)
 
         return reranked
@@ -1,9 +1,28 @@
 import os
 import json
+from collections import OrderedDict
 from dotenv import load_dotenv
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 load_dotenv()
 
+DEFAULT_MODELS = {
+    "groq": "llama-3.3-70b-versatile",
+    "openai": "gpt-4o",
+    "anthropic": "claude-sonnet-4-20250514",
+    "google": "gemini-2.0-flash",
+}
+
+RESPONSE_CACHE_SIZE = 256
+
+_response_cache: "OrderedDict[tuple, str]" = OrderedDict()
+
+_clients: dict = {}
+
 
 class LLMService:
     def __init__(self, provider: str | None = None, model: str | None = None, temperature: float = 0):
@@ -13,17 +32,17 @@ class LLMService:
         self._client = None
 
     def _default_model(self) -> str:
-        return {
-            "groq": "llama-3.3-70b-versatile",
-            "openai": "gpt-4o",
-            "anthropic": "claude-sonnet-4-20250514",
-            "google": "gemini-2.0-flash",
-        }.get(self.provider, "llama-3.3-70b-versatile")
+        return DEFAULT_MODELS.get(self.provider, DEFAULT_MODELS["groq"])
 
     def _get_client(self):
         if self._client is not None:
             return self._client
 
+        key = (self.provider, self.model, self.temperature)
+        if key in _clients:
+            self._client = _clients[key]
+            return self._client
+
         if self.provider == "groq":
             from langchain_groq import ChatGroq
             self._client = ChatGroq(
@@ -55,11 +74,22 @@ class LLMService:
         else:
             raise ValueError(f"Unknown provider: {self.provider}")
 
+        _clients[key] = self._client
         return self._client
 
     def invoke(self, system: str, human: str) -> str:
+        key = (self.provider, self.model, system, human) if self.temperature == 0 else None
+        if key is not None and key in _response_cache:
+            _response_cache.move_to_end(key)
+            return _response_cache[key]
+
         client = self._get_client()
         resp = client.invoke([("system", system), ("human", human)])
+
+        if key is not None:
+            _response_cache[key] = resp.content
+            if len(_response_cache) > RESPONSE_CACHE_SIZE:
+                _response_cache.popitem(last=False)
         return resp.content
 
     def invoke_json(self, system: str, human: str) -> dict:
@@ -67,4 +97,9 @@ class LLMService:
         content = self.invoke(prompt, human).strip()
         if content.startswith("```"):
             content = content.split("\n", 1)[-1].rsplit("```", 1)[0].strip()
+        if orjson is not None:
+            try:
+                return orjson.loads(content)
+            except orjson.JSONDecodeError:
+                pass
         return json.loads(content)
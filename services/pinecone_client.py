@@ -0,0 +1,21 @@
+import os
+from functools import lru_cache
+from dotenv import load_dotenv
+
+load_dotenv()
+
+
+@lru_cache(maxsize=1)
+def get_pinecone():
+    # Data-plane calls go over gRPC when the pinecone[grpc] extra is installed;
+    # the REST client remains the fallback (e.g. behind TLS-terminating proxies).
+    try:
+        from pinecone.grpc import PineconeGRPC as Pinecone
+    except ImportError:
+        from pinecone import Pinecone
+    return Pinecone(api_key=os.getenv("PINECONE_API_KEY"))
+
+
+@lru_cache(maxsize=None)
+def is_pod_index(name):
+    return getattr(get_pinecone().describe_index(name).spec, "pod", None) is not None
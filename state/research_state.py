@@ -1,14 +1,35 @@
-from typing import Annotated, Any, Dict, List, Optional
+from typing import Annotated, Any, Dict, Hashable, List, Optional
 from typing_extensions import TypedDict
 
 
+def _dedup_key(item: Any) -> Hashable:
+    if isinstance(item, dict):
+        return dict, frozenset((k, _dedup_key(v)) for k, v in item.items())
+    if isinstance(item, (list, tuple)):
+        return type(item) is tuple, tuple(_dedup_key(v) for v in item)
+    if isinstance(item, (set, frozenset)):
+        return frozenset, frozenset(item)
+    hash(item)
+    return item
+
+
 def _append_unique(left: list, right: list) -> list:
     result = list(left)
+    seen = set()
+    for item in result:
+        try:
+            seen.add(_dedup_key(item))
+        except TypeError:
+            pass
     for item in right:
-        if isinstance(item, dict):
+        try:
+            key = _dedup_key(item)
+        except TypeError:
             if item not in result:
                 result.append(item)
-        elif item not in result:
+            continue
+        if key not in seen:
+            seen.add(key)
             result.append(item)
     return result
 